@@ -1,24 +1,26 @@
+import asyncio
 from enum import Enum
+from functools import lru_cache
 from itertools import zip_longest
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 from ape.api import BlockAPI, EcosystemAPI, ReceiptAPI, TransactionAPI
 from ape.api.networks import ProxyInfoAPI
 from ape.contracts import ContractContainer, ContractInstance
+from ape.exceptions import ProviderNotConnectedError
 from ape.types import AddressType, ContractLog, RawAddress
-from eth_utils import is_0x_prefixed
 from ethpm_types import ContractType
-from ethpm_types.abi import ConstructorABI, EventABI, EventABIType, MethodABI
+from ethpm_types.abi import ABIType, ConstructorABI, EventABI, MethodABI
 from hexbytes import HexBytes
 from starknet_py.constants import OZ_PROXY_STORAGE_KEY
 from starknet_py.net.models.address import parse_address
 from starknet_py.net.models.chains import StarknetChainId
 from starknet_py.utils.data_transformer import DataTransformer
+from starkware.cairo.lang.cairo_constants import DEFAULT_PRIME
+from starkware.cairo.lang.compiler.identifier_manager import IdentifierManager
 from starkware.starknet.definitions.fields import ContractAddressSalt
 from starkware.starknet.definitions.transaction_type import TransactionType
-from starkware.starknet.public.abi import get_selector_from_name
 from starkware.starknet.public.abi_structs import identifier_manager_from_abi
-from starkware.starknet.services.api.contract_class import ContractClass
 
 from ape_starknet.exceptions import StarknetEcosystemError
 from ape_starknet.transactions import (
@@ -30,7 +32,12 @@ from ape_starknet.transactions import (
     InvokeFunctionTransaction,
     StarknetTransaction,
 )
-from ape_starknet.utils import to_checksum_address
+from ape_starknet.utils import (
+    cache_by_identity,
+    deserialize_contract_class,
+    get_selector,
+    to_checksum_address,
+)
 from ape_starknet.utils.basemodel import StarknetBase
 
 NETWORKS = {
@@ -38,6 +45,141 @@ NETWORKS = {
     "mainnet": (StarknetChainId.MAINNET.value, StarknetChainId.MAINNET.value),
     "testnet": (StarknetChainId.TESTNET.value, StarknetChainId.TESTNET.value),
 }
+_PROXY_VIEW_METHODS = {"implementation", "get_implementation"}
+
+
+@cache_by_identity()
+def _get_identifier_manager(full_abi: List) -> IdentifierManager:
+    # Building the identifier manager means walking the whole contract ABI,
+    # so only do it once per contract ABI. It only needs the struct definitions,
+    # so those are the only entries converted to dicts.
+    struct_abis = [
+        abi.dict() if hasattr(abi, "dict") else abi
+        for abi in full_abi
+        if (abi["type"] if isinstance(abi, dict) else abi.type) == "struct"
+    ]
+    return identifier_manager_from_abi(struct_abis)
+
+
+@cache_by_identity()
+def _get_transformer(
+    full_abi: List, method_abi: Union[ConstructorABI, MethodABI]
+) -> DataTransformer:
+    return DataTransformer(method_abi.dict(), _get_identifier_manager(full_abi))
+
+
+def _get_input_encoder(abi_input: ABIType) -> str:
+    # The name of the 'Starknet' method that pre-encodes values of this input.
+    # Names (rather than functions) are cached so that subclass overrides apply.
+    input_type = str(abi_input.type)
+    if input_type == "felt":
+        return "encode_primitive_value"
+    elif input_type == "felt*":
+        return "_pre_encode_felt_array"
+    elif input_type.endswith("*"):
+        return "_pre_encode_array"
+
+    return "_pre_encode_value"
+
+
+@cache_by_identity()
+def _get_input_plan(method_abi: Union[ConstructorABI, MethodABI]) -> List[Tuple[str, bool]]:
+    # One entry per argument: its pre-encoder name and whether it is an array that may
+    # be preceded by its length. The 'arr_len' and 'arr' inputs make one entry.
+    plan = []
+    inputs = method_abi.inputs
+    index = 0
+    while index < len(inputs):
+        abi_input = inputs[index]
+        if (
+            abi_input.name is not None
+            and abi_input.name.endswith("_len")
+            and index + 1 < len(inputs)
+            and str(inputs[index + 1].type).endswith("*")
+        ):
+            plan.append((_get_input_encoder(inputs[index + 1]), True))
+            index += 2
+        else:
+            plan.append((_get_input_encoder(abi_input), False))
+            index += 1
+
+    return plan
+
+
+@cache_by_identity()
+def _get_felt_args_layout(method_abi: Union[ConstructorABI, MethodABI]) -> Optional[List[bool]]:
+    # When a method only takes felts and length-prefixed felt arrays, its calldata
+    # is the flattened arguments with each array preceded by its length. Gives
+    # whether each argument is an array, or None when other types are involved.
+    input_types = [str(abi_input.type) for abi_input in method_abi.inputs]
+    if any(input_type not in ("felt", "felt*") for input_type in input_types):
+        return None
+
+    layout = [has_array_len for _, has_array_len in _get_input_plan(method_abi)]
+    return layout if sum(layout) == input_types.count("felt*") else None
+
+
+def _encode_felt_args(layout: List[bool], args: List[Any]) -> Optional[List[int]]:
+    if len(args) != len(layout):
+        return None
+
+    calldata: List[Any] = []
+    for is_array, arg in zip(layout, args):
+        if is_array:
+            calldata.append(len(arg))
+            calldata.extend(arg)
+        else:
+            calldata.append(arg)
+
+    # Anything else (e.g. short strings or out-of-range values) is left
+    # for the transformer to convert or reject.
+    if all(type(value) is int and 0 <= value < DEFAULT_PRIME for value in calldata):
+        return calldata
+
+    return None
+
+
+@lru_cache(maxsize=32)
+def _get_contract_class_data(code: bytes) -> str:
+    return deserialize_contract_class(code).dumps()
+
+
+_SCALAR, _UINT256, _ARRAY = range(3)
+
+
+@cache_by_identity()
+def _get_output_layout(abi: MethodABI) -> List[int]:
+    # Classifies each decoded output by how it reads the return data.
+    # 'felt*' outputs are read together with their preceding length output.
+    layout = []
+    for abi_output_cur, abi_output_next in zip_longest(abi.outputs, abi.outputs[1:]):
+        if abi_output_cur.type == "Uint256":
+            layout.append(_UINT256)
+        elif abi_output_cur.type == "felt" and abi_output_next and abi_output_next.type == "felt*":
+            layout.append(_ARRAY)
+        elif abi_output_cur.type != "felt*":
+            layout.append(_SCALAR)
+
+    return layout
+
+
+@cache_by_identity()
+def _get_event_layout(abi: EventABI) -> Tuple[List[Optional[str]], List[Tuple[bool, int]]]:
+    # The event argument names and, for each argument, whether it is a Uint256
+    # (stored using 2 slots) and the index of its first slot in the log data.
+    layout = []
+    index = 0
+    for abi_input in abi.inputs:
+        is_uint256 = abi_input.type == "Uint256"
+        layout.append((is_uint256, index))
+        index += 2 if is_uint256 else 1
+
+    return [a.name for a in abi.inputs], layout
+
+
+@cache_by_identity()
+def _get_mutable_methods_by_selector(contract_type: ContractType) -> Dict[int, MethodABI]:
+    return {get_selector(abi.name): abi for abi in contract_type.mutable_methods}
 
 
 class StarknetBlock(BlockAPI):
@@ -60,6 +202,30 @@ class StarknetProxy(ProxyInfoAPI):
     type: ProxyType
 
 
+@cache_by_identity()
+def _get_proxy_type(contract_type: ContractType) -> ProxyType:
+    # The kind of proxy check to make only depends on the contract's ABI.
+    # OpenZeppelin proxies have no identifying view method; they are confirmed
+    # by reading the implementation storage slot.
+    proxy_methods = {abi.name for abi in contract_type.view_methods} & _PROXY_VIEW_METHODS
+
+    # Legacy proxy check
+    if "implementation" in proxy_methods:
+        return ProxyType.LEGACY
+
+    # Argent-X proxy check
+    elif "get_implementation" in proxy_methods:
+        return ProxyType.ARGENT_X
+
+    return ProxyType.OPEN_ZEPPELIN
+
+
+_PROXY_IMPLEMENTATION_METHODS = {
+    ProxyType.LEGACY: "implementation",
+    ProxyType.ARGENT_X: "get_implementation",
+}
+
+
 class Starknet(EcosystemAPI, StarknetBase):
     """
     The Starknet ``EcosystemAPI`` implementation.
@@ -96,9 +262,7 @@ class Starknet(EcosystemAPI, StarknetBase):
         if not raw_data:
             return raw_data
 
-        raw_data = [self.encode_primitive_value(v) for v in raw_data]
-        iter_data = iter(raw_data)
-        decoded: List[Any] = []
+        raw_data = self._encode_primitive_values(raw_data)
 
         # Given that the caller is StarkNetProvider.send_transaction().
         # In the caller, we removed the first item which was the total items when
@@ -107,23 +271,21 @@ class Starknet(EcosystemAPI, StarknetBase):
         if len(raw_data) == 1:
             return raw_data[0]
 
-        for abi_output_cur, abi_output_next in zip_longest(abi.outputs, abi.outputs[1:]):
-            if abi_output_cur.type == "Uint256":
+        decoded: List[Any] = []
+        index = 0
+        for kind in _get_output_layout(abi):
+            if kind == _UINT256:
                 # Unint256 are stored using 2 slots
-                decoded.append((next(iter_data), next(iter_data)))
-            elif (
-                abi_output_cur.type == "felt"
-                and abi_output_next
-                and abi_output_next.type == "felt*"
-            ):
+                decoded.append((raw_data[index], raw_data[index + 1]))
+                index += 2
+            elif kind == _ARRAY:
                 # Array - strip off leading length
-                array_len = next(iter_data)
-                decoded.append([next(iter_data) for _ in range(array_len)])  # type: ignore
-            elif abi_output_cur.type == "felt*":
-                # The array was handled by the previous condition at the previous iteration
-                continue
+                start = index + 1
+                index = start + raw_data[index]
+                decoded.append(raw_data[start:index])
             else:
-                decoded.append(next(iter_data))
+                decoded.append(raw_data[index])
+                index += 1
 
         # Keep only the expected data instead of a 1-item array
         if len(abi.outputs) == 1 or (len(abi.outputs) == 2 and abi.outputs[1].type == "felt*"):
@@ -137,49 +299,41 @@ class Starknet(EcosystemAPI, StarknetBase):
         method_abi: Union[ConstructorABI, MethodABI],
         call_args: Union[List, Tuple],
     ) -> List:
-        full_abi = [abi.dict() if hasattr(abi, "dict") else abi for abi in full_abi]
-        id_manager = identifier_manager_from_abi(full_abi)
-        transformer = DataTransformer(method_abi.dict(), id_manager)
         pre_encoded_args: List[Any] = []
-        index = 0
-        last_index = min(len(method_abi.inputs), len(call_args)) - 1
-        did_process_array_during_arr_len = False
-
-        for call_arg, input_type in zip(call_args, method_abi.inputs):
-            if str(input_type.type).endswith("*"):
-                if did_process_array_during_arr_len:
-                    did_process_array_during_arr_len = False
-                    continue
-
-                encoded_arg = self._pre_encode_value(call_arg)
-                pre_encoded_args.append(encoded_arg)
-            elif (
-                input_type.name is not None
-                and input_type.name.endswith("_len")
-                and index < last_index
-                and str(method_abi.inputs[index + 1].type).endswith("*")
-            ):
-                pre_encoded_arg = self._pre_encode_value(call_arg)
-
-                if isinstance(pre_encoded_arg, int):
-                    # 'arr_len' was provided.
-                    array_index = index + 1
-                    pre_encoded_array = self._pre_encode_array(call_args[array_index])
-                    pre_encoded_args.append(pre_encoded_array)
-                    did_process_array_during_arr_len = True
-                else:
-                    pre_encoded_args.append(pre_encoded_arg)
+        arg_index = 0
 
-            else:
-                pre_encoded_args.append(self._pre_encode_value(call_arg))
+        for encoder, has_array_len in _get_input_plan(method_abi):
+            if arg_index >= len(call_args):
+                break
 
-            index += 1
+            call_arg = call_args[arg_index]
+            if has_array_len and isinstance(self.encode_primitive_value(call_arg), int):
+                # 'arr_len' was provided. It is not needed since the transformer
+                # gets the length from the array itself.
+                if arg_index + 1 >= len(call_args):
+                    # The array is missing; let the transformer report it.
+                    break
 
+                arg_index += 1
+                call_arg = call_args[arg_index]
+
+            pre_encoded_args.append(getattr(self, encoder)(call_arg))
+            arg_index += 1
+
+        felt_args_layout = _get_felt_args_layout(method_abi)
+        if felt_args_layout is not None:
+            encoded_felts = _encode_felt_args(felt_args_layout, pre_encoded_args)
+            if encoded_felts is not None:
+                return encoded_felts
+
+        transformer = _get_transformer(full_abi, method_abi)
         encoded_calldata, _ = transformer.from_python(*pre_encoded_args)
         return encoded_calldata
 
     def _pre_encode_value(self, value: Any) -> Any:
-        if isinstance(value, dict):
+        if type(value) is int:
+            return value
+        elif isinstance(value, dict):
             return self._pre_encode_struct(value)
         elif isinstance(value, (list, tuple)):
             return self._pre_encode_array(value)
@@ -189,34 +343,42 @@ class Starknet(EcosystemAPI, StarknetBase):
     def _pre_encode_array(self, array: Any) -> List:
         if not isinstance(array, (list, tuple)):
             # Will handle single item structs and felts.
-            return self._pre_encode_array([array])
+            array = [array]
 
-        encoded_array = []
-        for item in array:
-            encoded_value = self._pre_encode_value(item)
-            encoded_array.append(encoded_value)
+        encode = self._pre_encode_value
+        return [item if type(item) is int else encode(item) for item in array]
 
-        return encoded_array
+    def _pre_encode_felt_array(self, array: Any) -> List:
+        if not isinstance(array, (list, tuple)):
+            # Will handle single felts.
+            array = [array]
 
-    def _pre_encode_struct(self, struct: Dict) -> Dict:
-        encoded_struct = {}
-        for key, value in struct.items():
-            encoded_struct[key] = self._pre_encode_value(value)
+        return self._encode_primitive_values(array)
 
-        return encoded_struct
+    def _pre_encode_struct(self, struct: Dict) -> Dict:
+        encode = self._pre_encode_value
+        return {
+            key: value if type(value) is int else encode(value) for key, value in struct.items()
+        }
 
     def encode_primitive_value(self, value: Any) -> int:
-        if isinstance(value, int):
+        if type(value) is int:
             return value
 
-        elif isinstance(value, str) and is_0x_prefixed(value):
-            return int(value, 16)
+        elif isinstance(value, (bytes, bytearray)):
+            # Includes 'HexBytes'.
+            return int.from_bytes(value, "big")
 
-        elif isinstance(value, HexBytes):
-            return int(value.hex(), 16)
+        elif isinstance(value, str) and value.startswith(("0x", "0X")):
+            return int(value, 16)
 
         return value
 
+    def _encode_primitive_values(self, values: Union[List, Tuple]) -> List:
+        # Values are most often ints already; avoid the per-item dispatch for those.
+        encode = self.encode_primitive_value
+        return [v if type(v) is int else encode(v) for v in values]
+
     def decode_receipt(self, data: dict) -> ReceiptAPI:
         txn_type = TransactionType(data["type"])
         receipt_cls: Union[Type[ContractDeclaration], Type[DeployReceipt], Type[InvocationReceipt]]
@@ -253,12 +415,12 @@ class Starknet(EcosystemAPI, StarknetBase):
             salt = ContractAddressSalt.get_random_value()
 
         constructor_args = list(args)
-        contract = ContractClass.deserialize(deployment_bytecode)
+        contract = deserialize_contract_class(deployment_bytecode)
         calldata = self.encode_calldata(contract.abi, abi, constructor_args)
         return DeployTransaction(
             salt=salt,
             constructor_calldata=calldata,
-            contract_code=contract.dumps(),
+            contract_code=_get_contract_class_data(deployment_bytecode),
             token=kwargs.get("token"),
         )
 
@@ -288,8 +450,9 @@ class Starknet(EcosystemAPI, StarknetBase):
             if contract_type.deployment_bytecode
             else 0
         )
-        starknet_contract = ContractClass.deserialize(HexBytes(code))
-        return DeclareTransaction(contract_type=contract_type, data=starknet_contract.dumps())
+        return DeclareTransaction(
+            contract_type=contract_type, data=_get_contract_class_data(HexBytes(code))
+        )
 
     def create_transaction(self, **kwargs) -> TransactionAPI:
         txn_type = TransactionType(kwargs.pop("type", kwargs.pop("tx_type", "")))
@@ -328,42 +491,27 @@ class Starknet(EcosystemAPI, StarknetBase):
             if isinstance(selector, str):
                 selector = int(selector, 16)
 
-            for abi in contract.mutable_methods:
-                selector_to_check = get_selector_from_name(abi.name)
-
-                if selector == selector_to_check:
-                    txn_data["method_abi"] = abi
+            method_abi = _get_mutable_methods_by_selector(contract).get(selector)
+            if method_abi:
+                txn_data["method_abi"] = method_abi
 
         if "calldata" in txn_data and txn_data["calldata"] is not None:
             # Transactions in blocks show calldata as flattened hex-strs
             # but elsewhere we expect flattened ints. Convert to ints for
             # consistency and testing purposes.
-            encoded_calldata = [self.encode_primitive_value(v) for v in txn_data["calldata"]]
-            txn_data["calldata"] = encoded_calldata
+            txn_data["calldata"] = self._encode_primitive_values(txn_data["calldata"])
 
         return txn_cls(**txn_data)
 
     def decode_logs(self, abi: EventABI, raw_logs: List[Dict]) -> Iterator[ContractLog]:
-        event_key = get_selector_from_name(abi.name)
-        matching_logs = [log for log in raw_logs if event_key in log["keys"]]
-
-        def decode_items(
-            abi_types: List[EventABIType], data: List[int]
-        ) -> List[Union[int, Tuple[int, int]]]:
-            decoded: List[Union[int, Tuple[int, int]]] = []
-            iter_data = iter(data)
-            for abi_type in abi_types:
-                if abi_type.type == "Uint256":
-                    # unint256 are stored using 2 slots
-                    decoded.append((next(iter_data), next(iter_data)))
-                else:
-                    decoded.append(next(iter_data))
-            return decoded
+        event_key = get_selector(abi.name)
+        matching_logs = (log for log in raw_logs if event_key in log["keys"])
 
+        names, layout = _get_event_layout(abi)
         for index, log in enumerate(matching_logs):
-            event_args = dict(
-                zip([a.name for a in abi.inputs], decode_items(abi.inputs, log["data"]))
-            )
+            data = log["data"]
+            values = [(data[i], data[i + 1]) if is_uint256 else data[i] for is_uint256, i in layout]
+            event_args = dict(zip(names, values))
             yield ContractLog(  # type: ignore
                 name=abi.name,
                 index=index,
@@ -378,34 +526,83 @@ class Starknet(EcosystemAPI, StarknetBase):
         if not isinstance(contract, ContractInstance):
             return None
 
-        proxy_type: Optional[ProxyType] = None
-        target: Optional[int] = None
-
-        # Legacy proxy check
-        if "implementation" in contract.contract_type.view_methods:
-            instance = self.chain_manager.contracts.instance_at(address)
-            target = instance.implementation()  # type: ignore
-            proxy_type = ProxyType.LEGACY
-
-        # Argent-X proxy check
-        elif "get_implementation" in contract.contract_type.view_methods:
-            instance = self.chain_manager.contracts.instance_at(address)
-            target = instance.get_implementation()  # type: ignore
-            proxy_type = ProxyType.ARGENT_X
-
-        # OpenZeppelin proxy check
-        elif self.provider.client is not None:
-            address_int = self.encode_address(address)
-            target = self.provider.client.get_storage_at_sync(
-                contract_address=address_int, key=OZ_PROXY_STORAGE_KEY
-            )
-            if target == "0x0":
-                target = None
-            else:
-                proxy_type = ProxyType.OPEN_ZEPPELIN
+        proxy_type = _get_proxy_type(contract.contract_type)
+        if proxy_type != ProxyType.OPEN_ZEPPELIN:
+            return self._get_view_method_proxy_info(contract, proxy_type)
 
-        return (
-            StarknetProxy(target=self.decode_address(target), type=proxy_type)
-            if target and proxy_type
-            else None
+        elif self.provider.client is None:
+            return None
+
+        target = self.provider.client.get_storage_at_sync(
+            contract_address=self.encode_address(address), key=OZ_PROXY_STORAGE_KEY
         )
+        return self._get_proxy_info_from_target(target, ProxyType.OPEN_ZEPPELIN)
+
+    def get_proxy_infos(self, addresses: List[AddressType]) -> List[Optional[StarknetProxy]]:
+        """
+        Get the proxy info for many contracts at once. The contracts are looked up
+        first and then all of the implementation calls and storage reads are made
+        concurrently.
+
+        **NOTE**: Like the client's ``*_sync`` methods, this runs the event loop
+        until the requests complete, so it cannot be called from a coroutine.
+
+        Args:
+            addresses (List[AddressType]): The contract addresses.
+
+        Returns:
+            List[Optional[:class:`~ape_starknet.ecosystems.StarknetProxy`]]: The proxy
+            info for each address, in the same order.
+        """
+        client = self.provider.client
+        if client is None:
+            raise ProviderNotConnectedError()
+
+        proxy_infos: List[Optional[StarknetProxy]] = [None] * len(addresses)
+        proxy_types: Dict[int, ProxyType] = {}
+        requests = []
+        for index, address in enumerate(addresses):
+            contract = self.chain_manager.contracts.instance_at(address)
+            if not isinstance(contract, ContractInstance):
+                continue
+
+            proxy_type = _get_proxy_type(contract.contract_type)
+            if proxy_type == ProxyType.OPEN_ZEPPELIN:
+                request = client.get_storage_at(
+                    contract_address=self.encode_address(address), key=OZ_PROXY_STORAGE_KEY
+                )
+            else:
+                request = self._call_proxy_implementation(client, contract, proxy_type)
+
+            proxy_types[index] = proxy_type
+            requests.append(request)
+
+        targets = asyncio.get_event_loop().run_until_complete(asyncio.gather(*requests))
+        for (index, proxy_type), target in zip(proxy_types.items(), targets):
+            proxy_infos[index] = self._get_proxy_info_from_target(target, proxy_type)
+
+        return proxy_infos
+
+    async def _call_proxy_implementation(
+        self, client: Any, contract: ContractInstance, proxy_type: ProxyType
+    ) -> Any:
+        method_name = _PROXY_IMPLEMENTATION_METHODS[proxy_type]
+        abi = next(m for m in contract.contract_type.view_methods if m.name == method_name)
+        txn = self.encode_transaction(contract.address, abi)
+        return_data = await client.call_contract(txn.as_starknet_object())  # type: ignore
+        return self.decode_returndata(abi, return_data)
+
+    def _get_view_method_proxy_info(
+        self, contract: ContractInstance, proxy_type: ProxyType
+    ) -> Optional[StarknetProxy]:
+        method_name = _PROXY_IMPLEMENTATION_METHODS[proxy_type]
+        target = getattr(contract, method_name)()
+        return self._get_proxy_info_from_target(target, proxy_type)
+
+    def _get_proxy_info_from_target(
+        self, target: Any, proxy_type: ProxyType
+    ) -> Optional[StarknetProxy]:
+        if not target or target == "0x0":
+            return None
+
+        return StarknetProxy(target=self.decode_address(target), type=proxy_type)
@@ -25,12 +25,11 @@ from starkware.starknet.core.os.transaction_hash.transaction_hash import (
     calculate_deploy_transaction_hash,
     calculate_transaction_hash_common,
 )
-from starkware.starknet.public.abi import get_selector_from_name
 from starkware.starknet.services.api.contract_class import ContractClass
 from starkware.starknet.services.api.gateway.transaction import DECLARE_SENDER_ADDRESS
 from starkware.starknet.testing.contract_utils import get_contract_class
 
-from ape_starknet.utils import to_checksum_address
+from ape_starknet.utils import deserialize_contract_class, get_selector, to_checksum_address
 from ape_starknet.utils.basemodel import StarknetBase
 
 
@@ -78,7 +77,7 @@ class DeclareTransaction(StarknetTransaction):
 
     @property
     def starknet_contract(self) -> ContractClass:
-        return ContractClass.deserialize(self.data)
+        return deserialize_contract_class(self.data)
 
     @property
     def txn_hash(self) -> HexBytes:
@@ -119,7 +118,7 @@ class DeployTransaction(StarknetTransaction):
 
     @property
     def starknet_contract(self) -> Optional[ContractClass]:
-        return ContractClass.deserialize(self.data)
+        return deserialize_contract_class(self.data)
 
     @property
     def txn_hash(self) -> HexBytes:
@@ -180,7 +179,7 @@ class InvokeFunctionTransaction(StarknetTransaction):
 
     @property
     def entry_point_selector(self) -> int:
-        return get_selector_from_name(self.method_abi.name)
+        return get_selector(self.method_abi.name)
 
     @property
     def txn_hash(self) -> HexBytes:
@@ -367,7 +366,7 @@ class ContractDeclaration(StarknetReceipt):
             if not code:
                 continue
 
-            contract_class = ContractClass.deserialize(HexBytes(code))
+            contract_class = deserialize_contract_class(HexBytes(code))
             contract_cls = get_contract_class(contract_class=contract_class)
             computed_class_hash = compute_class_hash(contract_cls)
             if computed_class_hash == self.class_hash:
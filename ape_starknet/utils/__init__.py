@@ -1,5 +1,8 @@
 import re
-from typing import Any, Dict, Optional, Tuple, Union
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
 
 from ape.api.networks import LOCAL_NETWORK_NAME
 from ape.exceptions import ApeException, ContractLogicError, OutOfGasError, VirtualMachineError
@@ -21,6 +24,7 @@ from starknet_py.net.models import TransactionType
 from starknet_py.transaction_exceptions import TransactionRejectedError
 from starkware.crypto.signature.signature import get_random_private_key as get_random_pkey
 from starkware.starknet.definitions.general_config import StarknetChainId
+from starkware.starknet.public.abi import get_selector_from_name
 from starkware.starknet.services.api.contract_class import ContractClass
 from starkware.starknet.services.api.feeder_gateway.response_objects import (
     DeclareSpecificInfo,
@@ -40,6 +44,7 @@ _HEX_ADDRESS_REG_EXP = re.compile("(0x)?[0-9a-f]*", re.IGNORECASE | re.ASCII)
 """Same as from eth-utils except not limited length."""
 ALPHA_MAINNET_WL_DEPLOY_TOKEN_KEY = "ALPHA_MAINNET_WL_DEPLOY_TOKEN"
 DEFAULT_ACCOUNT_SEED = 13333337
+_T = TypeVar("_T")
 
 
 def get_chain_id(network_id: Union[str, int]) -> StarknetChainId:
@@ -173,6 +178,16 @@ def get_dict_from_tx_info(
     return txn_dict
 
 
+@lru_cache(maxsize=32)
+def deserialize_contract_class(code: bytes) -> ContractClass:
+    """
+    A cached ``ContractClass.deserialize()``. Compiled contracts are large and
+    parsing them is slow, yet the same contract is often declared or deployed
+    many times (such as in tests).
+    """
+    return ContractClass.deserialize(code)
+
+
 def convert_contract_class_to_contract_type(contract_class: ContractClass):
     return ContractType.parse_obj(
         {
@@ -185,6 +200,15 @@ def convert_contract_class_to_contract_type(contract_class: ContractClass):
     )
 
 
+@lru_cache(maxsize=4096)
+def get_selector(name: str) -> int:
+    """
+    A cached ``get_selector_from_name()``. Computing a selector means hashing
+    the name, which is wasteful to repeat for every transaction and event.
+    """
+    return get_selector_from_name(name)
+
+
 def from_uint(value: Tuple[int, int]) -> int:
     """Takes in Uint256-ish tuple, returns value."""
     return value[0] + (value[1] << 128)
@@ -200,3 +224,46 @@ def pad_hex_str(value: str, to_length: int = 66) -> str:
     actual_len = len(val)
     padding = "0" * (to_length - 2 - actual_len)
     return f"0x{padding}{val}"
+
+
+def cache_by_identity(maxsize: int = 256) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
+    """
+    Like ``functools.lru_cache()`` but keyed on the identity of the arguments,
+    so it works with unhashable objects such as ABI lists and pydantic models.
+    The cache holds a reference to the arguments so their ``id()`` cannot be
+    re-used by another object while the entry is alive.
+
+    Args:
+        maxsize (int): The maximum number of entries to keep.
+    """
+
+    def decorator(fn: Callable[..., _T]) -> Callable[..., _T]:
+        cache: "OrderedDict[Tuple[int, ...], Tuple[Tuple, _T]]" = OrderedDict()
+        lock = Lock()
+
+        @wraps(fn)
+        def wrapper(*args):
+            key = tuple(id(a) for a in args)
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    cache.move_to_end(key)
+                    return entry[1]
+
+            # Like 'lru_cache()', the function itself is called without holding the lock.
+            result = fn(*args)
+            with lock:
+                cache[key] = (args, result)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+            return result
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear  # type: ignore
+        return wrapper
+
+    return decorator
@@ -1,15 +1,29 @@
+import re
+
 import pytest
 from ape._compat import Literal
 from ape.types import AddressType
 from eth_typing import HexAddress, HexStr
-from ethpm_types.abi import EventABIType, MethodABI
+from ethpm_types.abi import ABIType, EventABIType, MethodABI
 from hexbytes import HexBytes
+from starkware.cairo.lang.cairo_constants import DEFAULT_PRIME
 from starkware.starknet.public.abi import get_selector_from_name
 
+from ape_starknet.ecosystems import _get_transformer
+
 INT_ADDRESS = 14543129564252315649550252856970912276603599239311963926081534426621736121411
 STR_ADDRESS = "0x20271ea04cB854E105d948019Ba1FCdFa61d76D73539700Ff6DD456bcB7bF443"
 HEXBYTES_ADDRESS = HexBytes(STR_ADDRESS)
 EVENT_NAME = "balance_increased"
+UINT256_STRUCT_ABI = {
+    "type": "struct",
+    "name": "Uint256",
+    "size": 2,
+    "members": [
+        {"name": "low", "offset": 0, "type": "felt"},
+        {"name": "high", "offset": 1, "type": "felt"},
+    ],
+}
 
 
 class CustomABI(MethodABI):
@@ -17,6 +31,15 @@ class CustomABI(MethodABI):
     type: Literal["function"] = "function"
 
 
+FELT_ARGS_ABI = CustomABI(
+    inputs=[
+        ABIType(name="value", type="felt"),
+        ABIType(name="arr_len", type="felt"),
+        ABIType(name="arr", type="felt*"),
+    ],
+)
+
+
 @pytest.fixture(scope="module")
 def raw_logs():
     return [
@@ -47,6 +70,39 @@ def test_encode_and_decode_address(value, ecosystem):
     assert re_encoded_address == INT_ADDRESS
 
 
+@pytest.mark.parametrize(
+    "block_hash, expected",
+    (
+        ("0x0123", HexBytes(b"\x01\x23")),
+        # Odd-length hashes are padded
+        ("0x123", HexBytes(b"\x01\x23")),
+    ),
+)
+def test_decode_block(ecosystem, block_hash, expected):
+    data = {
+        "block_hash": block_hash,
+        "block_number": 5,
+        "parent_block_hash": "0x0",
+        "transactions": [],
+        "timestamp": 1655305200,
+    }
+    block = ecosystem.decode_block(data)
+    assert block.hash == expected
+    assert block.number == 5
+
+
+def test_decode_block_invalid_hash(ecosystem):
+    data = {
+        "block_hash": "0x12 34",
+        "block_number": 5,
+        "parent_block_hash": "0x0",
+        "transactions": [],
+        "timestamp": 1655305200,
+    }
+    with pytest.raises(ValueError):
+        ecosystem.decode_block(data)
+
+
 def test_decode_logs(ecosystem, event_abi, raw_logs):
     actual = list(ecosystem.decode_logs(event_abi, raw_logs))
     assert len(actual) == 1
@@ -163,7 +219,78 @@ def test_decode_logs(ecosystem, event_abi, raw_logs):
                 (12, 13),  # last_uint256
             ],
         ),
+        # Long array followed by another value
+        (
+            CustomABI(
+                outputs=[
+                    EventABIType(name="arr_len", type="felt"),
+                    EventABIType(name="arr", type="felt*"),
+                    EventABIType(name="suffix", type="felt"),
+                ],
+            ),
+            [1000, *range(1000), 7],
+            [list(range(1000)), 7],
+        ),
     ],
 )
 def test_decode_returndata(abi, raw_data, expected, ecosystem):
     assert ecosystem.decode_returndata(abi, raw_data) == expected  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "call_args",
+    (
+        [1, 2, [3, 4]],
+        # Array without its length
+        [1, [3, 4]],
+        # Values needing conversion
+        ["0x1", 2, ["0x3", HexBytes(4)]],
+    ),
+)
+def test_encode_calldata(ecosystem, call_args):
+    abi = FELT_ARGS_ABI
+    expected = _get_transformer([abi], abi).from_python(1, [3, 4])[0]
+    assert expected == [1, 2, 3, 4]
+    assert ecosystem.encode_calldata([abi], abi, call_args) == expected
+
+
+@pytest.mark.parametrize(
+    "call_args, transformer_args",
+    (
+        # Short strings are left for the transformer to convert
+        (["abc", 2, [3, 4]], ("abc", [3, 4])),
+        ([1, ["abc", "0x4"]], (1, ["abc", 4])),
+    ),
+)
+def test_encode_calldata_short_strings(ecosystem, call_args, transformer_args):
+    abi = FELT_ARGS_ABI
+    expected = _get_transformer([abi], abi).from_python(*transformer_args)[0]
+    assert ecosystem.encode_calldata([abi], abi, call_args) == expected
+
+
+@pytest.mark.parametrize(
+    "call_args, transformer_args",
+    (
+        ([DEFAULT_PRIME, [3, 4]], (DEFAULT_PRIME, [3, 4])),
+        ([1, [3, DEFAULT_PRIME]], (1, [3, DEFAULT_PRIME])),
+    ),
+)
+def test_encode_calldata_out_of_range(ecosystem, call_args, transformer_args):
+    abi = FELT_ARGS_ABI
+    with pytest.raises(Exception) as transformer_err:
+        _get_transformer([abi], abi).from_python(*transformer_args)
+
+    with pytest.raises(transformer_err.type, match=re.escape(str(transformer_err.value))):
+        ecosystem.encode_calldata([abi], abi, call_args)
+
+
+@pytest.mark.parametrize("value", ({"low": 1, "high": 2}, {"high": 2, "low": "0x1"}))
+def test_encode_calldata_struct(ecosystem, value):
+    abi = CustomABI(
+        inputs=[
+            ABIType(name="value", type="felt"),
+            ABIType(name="amount", type="Uint256"),
+        ],
+    )
+    full_abi = [UINT256_STRUCT_ABI, abi]
+    assert ecosystem.encode_calldata(full_abi, abi, [3, value]) == [3, 1, 2]
@@ -3,7 +3,9 @@ from pathlib import Path
 import pytest
 from ape.api.networks import LOCAL_NETWORK_NAME
 
+from ape_starknet import ecosystems
 from ape_starknet import tokens as _tokens
+from ape_starknet.ecosystems import ProxyType
 
 
 @pytest.fixture(scope="module")
@@ -85,3 +87,31 @@ def test_event_log_arguments(token_contract, account, second_account):
     assert log.amount0 == amount0_uint256
     assert log.amount1 == amount1_uint256
     assert log.to == int(second_account.address, 16)
+
+
+def test_get_proxy_infos(ecosystem, token_contract, proxy_token_contract):
+    addresses = [token_contract.address, proxy_token_contract.address]
+    proxy_infos = ecosystem.get_proxy_infos(addresses)
+    assert proxy_infos == [ecosystem.get_proxy_info(a) for a in addresses]
+
+    # The token is checked as an OpenZeppelin proxy and has no implementation stored
+    token_proxy_info, proxy_token_proxy_info = proxy_infos
+    assert token_proxy_info is None
+    assert proxy_token_proxy_info.target == token_contract.address
+    assert proxy_token_proxy_info.type == ProxyType.LEGACY
+
+
+def test_get_proxy_infos_open_zeppelin(
+    monkeypatch, ecosystem, token_contract, proxy_token_contract
+):
+    # The proxy stores its implementation in the OpenZeppelin storage slot,
+    # so it is also detected by reading that slot.
+    monkeypatch.setattr(ecosystems, "_get_proxy_type", lambda _: ProxyType.OPEN_ZEPPELIN)
+    addresses = [token_contract.address, proxy_token_contract.address]
+    proxy_infos = ecosystem.get_proxy_infos(addresses)
+    assert proxy_infos == [ecosystem.get_proxy_info(a) for a in addresses]
+
+    token_proxy_info, proxy_token_proxy_info = proxy_infos
+    assert token_proxy_info is None
+    assert proxy_token_proxy_info.target == token_contract.address
+    assert proxy_token_proxy_info.type == ProxyType.OPEN_ZEPPELIN
@@ -1,7 +1,8 @@
 import pytest
 from hexbytes import HexBytes
 
-from ape_starknet.utils import get_random_private_key
+from ape_starknet.accounts import OPEN_ZEPPELIN_ACCOUNT_CONTRACT_TYPE
+from ape_starknet.utils import cache_by_identity, deserialize_contract_class, get_random_private_key
 
 
 @pytest.mark.parametrize("iteration", range(10))
@@ -11,3 +12,36 @@ def test_get_random_private_key(iteration):
     pkey_int = int(pkey, 16)
     pkey_back_to_str = HexBytes(pkey_int).hex()
     assert pkey_back_to_str.replace("0x", "") in pkey
+
+
+def test_cache_by_identity():
+    calls = []
+
+    @cache_by_identity(maxsize=2)
+    def get_length(value):
+        calls.append(value)
+        return len(value)
+
+    value_0 = [1, 2]
+    value_1 = [1, 2]
+    assert get_length(value_0) == 2
+    assert get_length(value_0) == 2
+    assert len(calls) == 1
+
+    # Equal but not identical arguments are cached separately.
+    assert get_length(value_1) == 2
+    assert len(calls) == 2
+
+    # The least-recently used entry is evicted.
+    get_length([3])
+    get_length(value_0)
+    assert len(calls) == 4
+
+
+def test_deserialize_contract_class():
+    code = OPEN_ZEPPELIN_ACCOUNT_CONTRACT_TYPE.deployment_bytecode.bytecode
+    contract_class = deserialize_contract_class(HexBytes(code))
+
+    # Re-wrapped copies of the same bytecode share the parsed class (and its ABI).
+    assert deserialize_contract_class(HexBytes(code)) is contract_class
+    assert contract_class.abi